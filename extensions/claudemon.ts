@@ -210,72 +210,90 @@ function getColorFn(pct: number, theme: any): (s: string) => string {
   return (s: string) => theme.fg("error", s);
 }
 
+// Donut geometry is fixed: find the ring cells and their angle (clockwise
+// from top) once at load instead of on every frame.
+const DONUT_OUTER_R = 6.5;
+const DONUT_INNER_R = 5.0;
+const DONUT_ROWS = Math.floor(DONUT_OUTER_R * 2) + 1;
+const DONUT_COLS = Math.floor(DONUT_OUTER_R * 4) + 1;
+const DONUT_CENTER_Y = DONUT_OUTER_R;
+const DONUT_CENTER_X = DONUT_OUTER_R * 2;
+
+type DonutCell = { char: string; style: ((s: string) => string) | null };
+
+const BLANK_CELL: DonutCell = { char: " ", style: null };
+const RING_CELLS: Array<{ row: number; col: number; angle: number }> = [];
+for (let row = 0; row < DONUT_ROWS; row++) {
+  for (let col = 0; col < DONUT_COLS; col++) {
+    const dy = row - DONUT_CENTER_Y;
+    const dx = (col - DONUT_CENTER_X) / 2.0;
+    const dist = Math.sqrt(dx * dx + dy * dy);
+    if (DONUT_INNER_R <= dist && dist <= DONUT_OUTER_R) {
+      let angle = Math.atan2(dx, -dy);
+      if (angle < 0) angle += 2 * Math.PI;
+      RING_CELLS.push({ row, col, angle });
+    }
+  }
+}
+
 function renderDonut(pct: number, label: string, resetTime: Date | null, theme: any): string[] {
   const clamped = Math.max(0, Math.min(100, pct));
   const colorFn = getColorFn(clamped, theme);
 
-  const outerR = 6.5;
-  const innerR = 5.0;
-  const rows = Math.floor(outerR * 2) + 1;
-  const cols = Math.floor(outerR * 4) + 1;
+  const rows = DONUT_ROWS;
+  const cols = DONUT_COLS;
   const usedAngle = 2 * Math.PI * (clamped / 100);
-  const centerY = outerR;
-  const centerX = outerR * 2;
-
-  const grid: { char: string; style: ((s: string) => string) | null }[][] = [];
-
-  for (let row = 0; row < rows; row++) {
-    const line: { char: string; style: ((s: string) => string) | null }[] = [];
-    for (let col = 0; col < cols; col++) {
-      const dy = row - centerY;
-      const dx = (col - centerX) / 2.0;
-      const dist = Math.sqrt(dx * dx + dy * dy);
-
-      if (innerR <= dist && dist <= outerR) {
-        let angle = Math.atan2(dx, -dy);
-        if (angle < 0) angle += 2 * Math.PI;
-        if (angle <= usedAngle) {
-          line.push({ char: "█", style: colorFn });
-        } else {
-          line.push({ char: "░", style: (s: string) => theme.fg("dim", s) });
-        }
-      } else {
-        line.push({ char: " ", style: null });
-      }
-    }
-    grid.push(line);
+  const centerX = DONUT_CENTER_X;
+
+  const grid: DonutCell[][] = Array.from({ length: rows }, () =>
+    new Array<DonutCell>(cols).fill(BLANK_CELL),
+  );
+  const usedCell: DonutCell = { char: "█", style: colorFn };
+  const freeCell: DonutCell = { char: "░", style: (s: string) => theme.fg("dim", s) };
+  for (const { row, col, angle } of RING_CELLS) {
+    grid[row]![col] = angle <= usedAngle ? usedCell : freeCell;
   }
 
   // Place percentage in center
   const pctStr = `${Math.round(clamped)}%`;
   const centerRow = Math.floor(rows / 2);
   const startCol = Math.floor(centerX - pctStr.length / 2);
+  const pctStyle = (s: string) => theme.bold(colorFn(s));
   for (let i = 0; i < pctStr.length; i++) {
     const colIdx = startCol + i;
     if (colIdx >= 0 && colIdx < cols) {
-      grid[centerRow]![colIdx] = { char: pctStr[i]!, style: (s: string) => theme.bold(colorFn(s)) };
+      grid[centerRow]![colIdx] = { char: pctStr[i]!, style: pctStyle };
     }
   }
 
   // Place label below percentage
   const labelRow = centerRow + 1;
   const labelStart = Math.floor(centerX - label.length / 2);
+  const labelStyle = (s: string) => theme.fg("muted", s);
   if (labelRow < rows) {
     for (let i = 0; i < label.length; i++) {
       const colIdx = labelStart + i;
       if (colIdx >= 0 && colIdx < cols) {
-        grid[labelRow]![colIdx] = { char: label[i]!, style: (s: string) => theme.fg("muted", s) };
+        grid[labelRow]![colIdx] = { char: label[i]!, style: labelStyle };
       }
     }
   }
 
-  // Render grid to lines
+  // Render grid to lines, styling each run of same-style cells in one call
   const lines: string[] = [];
   for (const row of grid) {
     let line = "";
+    let run = "";
+    let runStyle = row[0]!.style;
     for (const cell of row) {
-      line += cell.style ? cell.style(cell.char) : cell.char;
+      if (cell.style !== runStyle) {
+        line += runStyle ? runStyle(run) : run;
+        run = "";
+        runStyle = cell.style;
+      }
+      run += cell.char;
     }
+    line += runStyle ? runStyle(run) : run;
     lines.push(line);
   }
 
@@ -2,9 +2,31 @@
  * API client for Claude OAuth usage endpoint.
  */
 
+import { createHash } from "node:crypto";
+
 import { type ModelQuota, type QuotaData, createQuotaData } from "./models.js";
 import { loadConfig } from "./config.js";
 
+// The last successful response and its ETag, so the next fetch can send
+// If-None-Match and reuse the parsed quota on a 304. Keyed on a hash of the
+// OAuth token so a different token never revalidates against it, and so
+// the raw secret is never held here.
+interface CachedQuota {
+  key: string;
+  quota: QuotaData;
+  etag: string;
+}
+
+let lastQuota: CachedQuota | null = null;
+
+function quotaCacheKey(oauthToken: string): string {
+  return createHash("sha256").update(oauthToken).digest("hex");
+}
+
+function storeCachedQuota(key: string, quota: QuotaData, etag: string | null): void {
+  lastQuota = etag ? { key, quota, etag } : null;
+}
+
 export class QuotaFetchError extends Error {
   constructor(message: string) {
     super(message);
@@ -30,7 +52,19 @@ export class RateLimitError extends QuotaFetchError {
   }
 }
 
-export async function fetchQuota(oauthToken: string): Promise<QuotaData> {
+/**
+ * GET the OAuth usage endpoint.
+ *
+ * Every request goes through Node's global fetch dispatcher, which keeps
+ * the TLS connection to api.anthropic.com alive between refreshes. Callers
+ * must always consume (or discard) the response body, otherwise the socket
+ * cannot be returned to the pool and the next refresh pays a new handshake.
+ */
+function requestUsage(
+  oauthToken: string,
+  timeoutMs: number,
+  etag?: string,
+): Promise<Response> {
   const config = loadConfig();
   const usageUrl = config["oauth_usage_url"] as string;
   const betaHeader = config["oauth_beta_header"] as string;
@@ -39,28 +73,58 @@ export async function fetchQuota(oauthToken: string): Promise<QuotaData> {
     Authorization: `Bearer ${oauthToken}`,
     "anthropic-beta": betaHeader,
   };
+  if (etag) headers["If-None-Match"] = etag;
+
+  return fetch(usageUrl, {
+    headers,
+    signal: AbortSignal.timeout(timeoutMs),
+  });
+}
+
+/** Read and drop the response body so the connection can be reused. */
+async function discardBody(resp: Response): Promise<void> {
+  try {
+    await resp.arrayBuffer();
+  } catch {
+    // Body already consumed or the stream errored — nothing to reuse.
+  }
+}
+
+/**
+ * Fetch quota data for `oauthToken`.  Revalidates with the previous
+ * response's ETag when there is one.
+ */
+export async function fetchQuota(oauthToken: string): Promise<QuotaData> {
+  const key = quotaCacheKey(oauthToken);
+  const cached = lastQuota?.key === key ? lastQuota : null;
 
   let resp: Response;
   try {
-    resp = await fetch(usageUrl, {
-      headers,
-      signal: AbortSignal.timeout(15000),
-    });
+    resp = await requestUsage(oauthToken, 15000, cached?.etag);
   } catch (e) {
     throw new QuotaFetchError(`Network error: ${e}`);
   }
 
+  // Unchanged since the cached response: skip parsing entirely
+  if (resp.status === 304 && cached) {
+    await discardBody(resp);
+    return cached.quota;
+  }
+
   if (resp.status === 401) {
+    await discardBody(resp);
     throw new AuthenticationError(
       "OAuth token is invalid or expired. Run 'claudemon setup' to re-authenticate.",
     );
   }
   if (resp.status === 403) {
+    await discardBody(resp);
     throw new AuthenticationError(
       "Access denied. Your token may lack the required permissions.",
     );
   }
   if (resp.status === 429) {
+    await discardBody(resp);
     const retryAfter = resp.headers.get("retry-after");
     const retryMs = retryAfter
       ? Number(retryAfter) * 1000
@@ -75,17 +139,21 @@ export async function fetchQuota(oauthToken: string): Promise<QuotaData> {
   }
 
   const data = (await resp.json()) as Record<string, unknown>;
-  return parseQuotaResponse(data);
+  const quota = parseQuotaResponse(data);
+  storeCachedQuota(key, quota, resp.headers.get("etag"));
+  return quota;
 }
 
 /**
  * Quick health-check: verifies that an OAuth token exists and is accepted
- * by the API.  Returns `{ ok: true }` on success, or `{ ok: false, reason }`
- * on failure.
+ * by the API.  Returns `{ ok: true, quota }` on success, or
+ * `{ ok: false, reason }` on failure.  The parsed quota lets the dashboard
+ * start without repeating the same request.
  */
 export async function validateToken(): Promise<
-  { ok: true } | { ok: false; reason: string }
+  { ok: true; quota: QuotaData } | { ok: false; reason: string }
 > {
+  // Loaded on demand so --help / --version never pull in auth.ts
   const { getValidOAuthToken } = await import("./auth.js");
   const token = await getValidOAuthToken();
 
@@ -96,26 +164,18 @@ export async function validateToken(): Promise<
     };
   }
 
-  const config = loadConfig();
-  const usageUrl = config["oauth_usage_url"] as string;
-  const betaHeader = config["oauth_beta_header"] as string;
-
   try {
-    const resp = await fetch(usageUrl, {
-      headers: {
-        Authorization: `Bearer ${token}`,
-        "anthropic-beta": betaHeader,
-      },
-      signal: AbortSignal.timeout(10000),
-    });
+    const resp = await requestUsage(token, 10000);
 
     if (resp.status === 401) {
+      await discardBody(resp);
       return {
         ok: false,
         reason: "OAuth token is invalid or expired. Please run 'claudemon setup --re' to re-authenticate.",
       };
     }
     if (resp.status === 403) {
+      await discardBody(resp);
       return {
         ok: false,
         reason: "Access denied. Your token may lack the required permissions. Run 'claudemon setup --re'.",
@@ -129,7 +189,19 @@ export async function validateToken(): Promise<
       };
     }
 
-    return { ok: true };
+    let data: Record<string, unknown>;
+    try {
+      data = (await resp.json()) as Record<string, unknown>;
+    } catch (e) {
+      return {
+        ok: false,
+        reason: `Usage endpoint returned an invalid response: ${e}`,
+      };
+    }
+    // Keep the ETag so the dashboard's first refresh can revalidate
+    const quota = parseQuotaResponse(data);
+    storeCachedQuota(quotaCacheKey(token), quota, resp.headers.get("etag"));
+    return { ok: true, quota };
   } catch (e) {
     return {
       ok: false,
@@ -138,66 +210,51 @@ export async function validateToken(): Promise<
   }
 }
 
-function parseQuotaResponse(data: Record<string, unknown>): QuotaData {
-  const quota = createQuotaData();
-
-  // Parse 5-hour window
-  const fiveHour = (data["five_hour"] ?? data["fiveHour"] ?? {}) as Record<
-    string,
-    unknown
-  >;
-  if (fiveHour) {
-    quota.fiveHourUsagePct =
-      (fiveHour["utilization"] as number) ??
-      (fiveHour["usage_pct"] as number) ??
-      0;
-    const resetAt =
-      (fiveHour["resets_at"] as string) ??
-      (fiveHour["reset_at"] as string) ??
-      (fiveHour["resetAt"] as string);
-    if (resetAt) {
-      quota.fiveHourResetTime = parseISOTime(resetAt);
-    }
-  }
+// Accepted key aliases for each response field, in priority order.
+const FIVE_HOUR_KEYS = ["five_hour", "fiveHour"] as const;
+const SEVEN_DAY_KEYS = ["seven_day", "sevenDay"] as const;
+const MODELS_KEYS = ["models", "model_quotas"] as const;
+const MODEL_NAME_KEYS = ["model", "name"] as const;
+const USAGE_KEYS = ["utilization", "usage_pct"] as const;
+const RESET_KEYS = ["resets_at", "reset_at", "resetAt"] as const;
+const PLAN_TYPE_KEYS = ["plan_type", "planType"] as const;
 
-  // Parse 7-day window
-  const sevenDay = (data["seven_day"] ?? data["sevenDay"] ?? {}) as Record<
-    string,
-    unknown
-  >;
-  if (sevenDay) {
-    quota.sevenDayUsagePct =
-      (sevenDay["utilization"] as number) ??
-      (sevenDay["usage_pct"] as number) ??
-      0;
-    const resetAt =
-      (sevenDay["resets_at"] as string) ??
-      (sevenDay["reset_at"] as string) ??
-      (sevenDay["resetAt"] as string);
-    if (resetAt) {
-      quota.sevenDayResetTime = parseISOTime(resetAt);
-    }
+/** Return the first non-null value found under `keys`, else `fallback`. */
+function firstPresent<T>(
+  obj: Record<string, unknown>,
+  keys: readonly string[],
+  fallback: T,
+): T {
+  for (const key of keys) {
+    const value = obj[key];
+    if (value !== undefined && value !== null) return value as T;
   }
+  return fallback;
+}
 
-  // Parse model-specific quotas
-  const models = (data["models"] ?? data["model_quotas"] ?? []) as Array<
-    Record<string, unknown>
-  >;
-  for (const m of models) {
-    const name =
-      (m["model"] as string) ?? (m["name"] as string) ?? "unknown";
-    const usage =
-      (m["utilization"] as number) ?? (m["usage_pct"] as number) ?? 0;
-    quota.modelQuotas.push({ modelName: name, usagePct: usage } as ModelQuota);
-  }
+function parseQuotaResponse(data: Record<string, unknown>): QuotaData {
+  const fiveHour = firstPresent<Record<string, unknown>>(data, FIVE_HOUR_KEYS, {});
+  const sevenDay = firstPresent<Record<string, unknown>>(data, SEVEN_DAY_KEYS, {});
+  const models = firstPresent<Array<Record<string, unknown>>>(data, MODELS_KEYS, []);
 
-  // Plan type
-  quota.planType =
-    (data["plan_type"] as string) ?? (data["planType"] as string) ?? "pro";
+  const fiveHourReset = firstPresent<string | undefined>(fiveHour, RESET_KEYS, undefined);
+  const sevenDayReset = firstPresent<string | undefined>(sevenDay, RESET_KEYS, undefined);
 
-  return quota;
+  // Collect every field first and build the object once
+  return createQuotaData({
+    fiveHourUsagePct: firstPresent(fiveHour, USAGE_KEYS, 0),
+    fiveHourResetTime: fiveHourReset ? parseISOTime(fiveHourReset) : null,
+    sevenDayUsagePct: firstPresent(sevenDay, USAGE_KEYS, 0),
+    sevenDayResetTime: sevenDayReset ? parseISOTime(sevenDayReset) : null,
+    modelQuotas: models.map((m): ModelQuota => ({
+      modelName: firstPresent(m, MODEL_NAME_KEYS, "unknown"),
+      usagePct: firstPresent(m, USAGE_KEYS, 0),
+    })),
+    planType: firstPresent(data, PLAN_TYPE_KEYS, "pro"),
+  });
 }
 
 function parseISOTime(timeStr: string): Date {
-  return new Date(timeStr.replace("Z", "+00:00").endsWith("+00:00") ? timeStr : timeStr);
+  // Date parses both "Z" and "+00:00" offsets natively
+  return new Date(timeStr);
 }
@@ -6,35 +6,57 @@ import React, { useCallback, useEffect, useRef, useState } from "react";
 import { Box, Text, useApp, useInput, useStdout } from "ink";
 
 import { fetchQuota, AuthenticationError, QuotaFetchError, RateLimitError } from "./api.js";
-import { getValidOAuthToken, isAuthenticated } from "./auth.js";
+import {
+  getValidOAuthToken,
+  invalidateCredentialsCache,
+  isAuthenticated,
+} from "./auth.js";
 import { loadConfig } from "./config.js";
-import { type QuotaData } from "./models.js";
+import { type QuotaData, quotaDataEqual } from "./models.js";
 import { HeaderBar } from "./components/HeaderBar.js";
 import { PieChart } from "./components/PieChart.js";
 
-
-const WEEKLY_REFRESH_INTERVAL = 300; // 5 minutes in seconds
+interface RefreshState {
+  quotaData: QuotaData | null;
+  isLoading: boolean;
+  errorMessage: string;
+  /** performance.now() of the last successful refresh, or 0 if none yet. */
+  lastRefreshAt: number;
+  refreshInterval: number;
+}
 
 interface AppProps {
   version?: string;
+  /** Quota already fetched during startup validation, if any. */
+  initialQuota?: QuotaData;
 }
 
-export function App({ version = "" }: AppProps): React.ReactElement {
+export function App({ version = "", initialQuota }: AppProps): React.ReactElement {
   const { exit } = useApp();
-  const config = useRef(loadConfig());
-  const baseRefreshInterval = Number(config.current["refresh_interval"] ?? 30);
-  const [refreshInterval, setRefreshInterval] = useState(baseRefreshInterval);
-
-  const [quotaData, setQuotaData] = useState<QuotaData | null>(null);
-  const [planType, setPlanType] = useState<string>(
-    String(config.current["plan_type"] ?? "pro"),
-  );
-  const [lastRefreshAgo, setLastRefreshAgo] = useState(0);
-  const [isLoading, setIsLoading] = useState(true);
-  const [errorMessage, setErrorMessage] = useState("");
+  // Lazy initializer: read config.toml once per mount, not on every render
+  const [config] = useState(loadConfig);
+  const baseRefreshInterval = Number(config["refresh_interval"] ?? 30);
+  const defaultPlanType = String(config["plan_type"] ?? "pro");
+
+  // Everything a refresh touches lives in one state object. Ink renders each
+  // setState made outside an input handler synchronously, so separate
+  // setters cost several renders per refresh; this way it's one per phase.
+  const [refresh, setRefresh] = useState<RefreshState>(() => ({
+    quotaData: initialQuota ?? null,
+    isLoading: !initialQuota,
+    errorMessage: "",
+    // Monotonic timestamps: wall-clock adjustments can't make "ago" go negative
+    lastRefreshAt: initialQuota ? performance.now() : 0,
+    refreshInterval: baseRefreshInterval,
+  }));
+  const { quotaData, isLoading, errorMessage, lastRefreshAt, refreshInterval } =
+    refresh;
+  // Derived rather than stored, so a refresh doesn't need a second update
+  const planType = quotaData?.planType || defaultPlanType;
   const [showHelp, setShowHelp] = useState(false);
-  const lastRefreshTime = useRef(0);
-  const authenticated = useRef(isAuthenticated());
+  const refreshInFlight = useRef(false);
+  // Checked once per mount: on macOS this shells out to the Keychain
+  const [authenticated] = useState(isAuthenticated);
   const { stdout } = useStdout();
   const [termRows, setTermRows] = useState(stdout.rows ?? 24);
 
@@ -44,73 +66,75 @@ export function App({ version = "" }: AppProps): React.ReactElement {
     return () => { stdout.off("resize", onResize); };
   }, [stdout]);
 
-  const doRefresh = useCallback(async (weekly = false) => {
-    setIsLoading(true);
-    setErrorMessage("");
+  // One fetch returns both the 5-hour and 7-day windows, so a single
+  // refresh loop keeps both charts current.
+  const doRefresh = useCallback(async () => {
+    // Let an in-progress request finish instead of stacking another on top
+    if (refreshInFlight.current) return;
+    refreshInFlight.current = true;
+    setRefresh((s) => ({ ...s, isLoading: true, errorMessage: "" }));
 
     try {
+      // Resolved per refresh so expired credentials are skipped or refreshed
+      // before the request; the credentials cache keeps this cheap.
       const token = await getValidOAuthToken();
       if (!token) return;
 
       const quota = await fetchQuota(token);
-      setQuotaData(quota);
-      setPlanType(quota.planType || String(config.current["plan_type"] ?? "pro"));
-      lastRefreshTime.current = Date.now();
-      setLastRefreshAgo(0);
-      setIsLoading(false);
-      // Restore normal interval on success
-      setRefreshInterval(baseRefreshInterval);
+      setRefresh((s) => ({
+        // Keep the previous object when the numbers are unchanged so the
+        // memoized charts see identical props and skip re-rendering
+        quotaData:
+          s.quotaData && quotaDataEqual(s.quotaData, quota) ? s.quotaData : quota,
+        isLoading: false,
+        errorMessage: "",
+        lastRefreshAt: performance.now(),
+        // Restore normal interval on success
+        refreshInterval: baseRefreshInterval,
+      }));
     } catch (e) {
-      setIsLoading(false);
+      let message: string;
+      let backoffSec: number | null = null;
       if (e instanceof RateLimitError) {
-        const backoffSec = Math.ceil(e.retryAfterMs / 1000);
-        setRefreshInterval(backoffSec);
-        setErrorMessage(`Rate limited — backing off ${backoffSec}s`);
+        backoffSec = Math.ceil(e.retryAfterMs / 1000);
+        message = `Rate limited — backing off ${backoffSec}s`;
       } else if (e instanceof AuthenticationError) {
-        setErrorMessage(e.message);
+        invalidateCredentialsCache();
+        message = e.message;
       } else if (e instanceof QuotaFetchError) {
-        setErrorMessage(`Fetch error: ${e.message}`);
+        message = `Fetch error: ${e.message}`;
       } else {
-        setErrorMessage(`Error: ${e}`);
+        message = `Error: ${e}`;
       }
+      setRefresh((s) => ({
+        ...s,
+        isLoading: false,
+        errorMessage: message,
+        refreshInterval: backoffSec ?? s.refreshInterval,
+      }));
+    } finally {
+      refreshInFlight.current = false;
     }
   }, [baseRefreshInterval]);
 
-  // Initial fetch
+  // Initial fetch (skipped when startup validation already returned data)
+  const seeded = useRef(initialQuota !== undefined);
   useEffect(() => {
-    if (authenticated.current) {
+    if (seeded.current) {
+      seeded.current = false;
+      return;
+    }
+    if (authenticated) {
       doRefresh();
     }
-  }, [doRefresh]);
+  }, [authenticated, doRefresh]);
 
   // Session refresh interval
   useEffect(() => {
-    if (!authenticated.current) return;
+    if (!authenticated) return;
     const id = setInterval(() => doRefresh(), refreshInterval * 1000);
     return () => clearInterval(id);
-  }, [doRefresh, refreshInterval]);
-
-  // Weekly refresh interval
-  useEffect(() => {
-    if (!authenticated.current) return;
-    const id = setInterval(
-      () => doRefresh(true),
-      WEEKLY_REFRESH_INTERVAL * 1000,
-    );
-    return () => clearInterval(id);
-  }, [doRefresh]);
-
-  // Tick refresh counter every second
-  useEffect(() => {
-    const id = setInterval(() => {
-      if (lastRefreshTime.current > 0) {
-        setLastRefreshAgo(
-          Math.floor((Date.now() - lastRefreshTime.current) / 1000),
-        );
-      }
-    }, 1000);
-    return () => clearInterval(id);
-  }, []);
+  }, [authenticated, doRefresh, refreshInterval]);
 
   // Keybindings
   useInput((input, key) => {
@@ -123,12 +147,12 @@ export function App({ version = "" }: AppProps): React.ReactElement {
     }
   });
 
-  if (!authenticated.current) {
+  if (!authenticated) {
     return (
       <Box marginTop={1}><Box flexDirection="column" borderStyle="round" width="100%" height={termRows - 1}>
         <HeaderBar
           planType={planType}
-          lastRefreshAgo={0}
+          lastRefreshAt={0}
           isLoading={false}
           errorMessage=""
         />
@@ -155,7 +179,7 @@ export function App({ version = "" }: AppProps): React.ReactElement {
       <Box marginTop={1}><Box flexDirection="column" borderStyle="round" width="100%" height={termRows - 1}>
         <HeaderBar
           planType={planType}
-          lastRefreshAgo={lastRefreshAgo}
+          lastRefreshAt={lastRefreshAt}
           isLoading={isLoading}
           errorMessage={errorMessage}
         />
@@ -177,7 +201,7 @@ export function App({ version = "" }: AppProps): React.ReactElement {
     <Box marginTop={1}><Box flexDirection="column" borderStyle="round" width="100%" height={termRows - 1}>
       <HeaderBar
         planType={planType}
-        lastRefreshAgo={lastRefreshAgo}
+        lastRefreshAt={lastRefreshAt}
         isLoading={isLoading}
         errorMessage={errorMessage}
       />
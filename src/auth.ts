@@ -11,9 +11,8 @@
 import { execFileSync, spawn } from "node:child_process";
 import {
   chmodSync,
-  existsSync,
   readFileSync,
-  unlinkSync,
+  rmSync,
   writeFileSync,
 } from "node:fs";
 import { homedir, platform } from "node:os";
@@ -52,16 +51,16 @@ function readKeychainCredentials(): Record<string, unknown> | null {
         "-w",
       ],
       { timeout: 5000, encoding: "utf-8", stdio: ["pipe", "pipe", "pipe"] },
-    );
-    if (!raw.trim()) return null;
-    return JSON.parse(raw.trim()) as Record<string, unknown>;
+    ).trim();
+    if (!raw) return null;
+    return JSON.parse(raw) as Record<string, unknown>;
   } catch {
     return null;
   }
 }
 
 function readFileCredentials(): Record<string, unknown> | null {
-  if (!existsSync(CLAUDE_CREDENTIALS_FILE)) return null;
+  // A missing file lands in the catch; no separate existence check
   try {
     const raw = readFileSync(CLAUDE_CREDENTIALS_FILE, "utf-8");
     return JSON.parse(raw) as Record<string, unknown>;
@@ -70,9 +69,32 @@ function readFileCredentials(): Record<string, unknown> | null {
   }
 }
 
+// Reading the Keychain spawns /usr/bin/security, so the raw credential
+// sources are cached briefly. Expiry is still checked on every lookup.
+const CREDENTIALS_CACHE_TTL_MS = 30_000;
+
+let credentialsCache: {
+  readAt: number;
+  sources: Array<Record<string, unknown> | null>;
+} | null = null;
+
+function readCredentialSources(): Array<Record<string, unknown> | null> {
+  const now = performance.now();
+  if (credentialsCache && now - credentialsCache.readAt < CREDENTIALS_CACHE_TTL_MS) {
+    return credentialsCache.sources;
+  }
+  const sources = [readKeychainCredentials(), readFileCredentials()];
+  credentialsCache = { readAt: now, sources };
+  return sources;
+}
+
+/** Force the next credential lookup to re-read the Keychain and files. */
+export function invalidateCredentialsCache(): void {
+  credentialsCache = null;
+}
+
 function getClaudeCodeCredentials(): OAuthCredentials | null {
-  for (const reader of [readKeychainCredentials, readFileCredentials]) {
-    const data = reader();
+  for (const data of readCredentialSources()) {
     if (data) {
       const oauth = data["claudeAiOauth"] as OAuthCredentials | undefined;
       if (oauth?.accessToken) {
@@ -96,7 +118,6 @@ export function storeToken(tokenData: Record<string, unknown>): void {
 }
 
 export function loadToken(): Record<string, unknown> | null {
-  if (!existsSync(TOKEN_FILE)) return null;
   try {
     return JSON.parse(readFileSync(TOKEN_FILE, "utf-8")) as Record<
       string,
@@ -205,7 +226,7 @@ export function isAuthenticated(): boolean {
 }
 
 export function clearToken(): void {
-  if (existsSync(TOKEN_FILE)) unlinkSync(TOKEN_FILE);
+  rmSync(TOKEN_FILE, { force: true });
 }
 
 // ---------------------------------------------------------------------------
@@ -244,16 +265,19 @@ const PLAN_NAMES: Record<string, string> = {
   default_claude_max_20x: "max",
 };
 
+// Fallback for subscription types not in PLAN_NAMES; anything else is "pro"
+const MAX_PLAN_PATTERN = /max/i;
+
+/** Map a Claude Code subscriptionType to "pro" or "max". */
+function planFromSubscription(subType: string): string {
+  const plan = PLAN_NAMES[subType];
+  if (plan) return plan;
+  return MAX_PLAN_PATTERN.test(subType) ? "max" : "pro";
+}
+
 export function detectPlanType(): string {
   const subType = getSubscriptionType();
-  if (subType) {
-    const plan = PLAN_NAMES[subType];
-    if (plan) return plan;
-    const lower = subType.toLowerCase();
-    if (lower.includes("max")) return "max";
-    if (lower.includes("pro")) return "pro";
-  }
-  return "pro";
+  return subType ? planFromSubscription(subType) : "pro";
 }
 
 // ---------------------------------------------------------------------------
@@ -384,11 +408,13 @@ export async function interactiveSetup(forceReauth = false): Promise<void> {
       console.log("  Token found");
     }
 
-    const subType = creds.subscriptionType ?? "";
-    const plan = PLAN_NAMES[subType] ?? subType;
-    if (plan) {
-      config["plan_type"] = plan === "pro" || plan === "max" ? plan : "pro";
-      console.log(`  Plan:  ${(plan as string).toUpperCase()}`);
+    // Classify from the credentials already in hand rather than reading
+    // them again through detectPlanType()
+    const subType = creds.subscriptionType;
+    if (subType) {
+      const plan = planFromSubscription(subType);
+      config["plan_type"] = plan;
+      console.log(`  Plan:  ${plan.toUpperCase()}`);
     }
 
     saveConfig(config);
@@ -2,23 +2,40 @@
  * Header bar component showing title, plan type, and refresh status.
  */
 
-import React from "react";
+import React, { useEffect, useState } from "react";
 import { Box, Text } from "ink";
 import chalk from "chalk";
 
 interface HeaderBarProps {
     planType: string;
-    lastRefreshAgo: number;
+    /** performance.now() timestamp of the last refresh, or 0 if none yet. */
+    lastRefreshAt: number;
     isLoading: boolean;
     errorMessage: string;
 }
 
 export function HeaderBar({
     planType,
-    lastRefreshAgo,
+    lastRefreshAt,
     isLoading,
     errorMessage,
 }: HeaderBarProps): React.ReactElement {
+    // The "Ns ago" counter ticks here so only the header re-renders each
+    // second, and only while that status is actually on screen.
+    const [lastRefreshAgo, setLastRefreshAgo] = useState(0);
+    const showAgo = lastRefreshAt > 0 && !isLoading && !errorMessage;
+
+    useEffect(() => {
+        setLastRefreshAgo(0);
+        if (!showAgo) return;
+        const id = setInterval(() => {
+            setLastRefreshAgo(
+                Math.floor((performance.now() - lastRefreshAt) / 1000),
+            );
+        }, 1000);
+        return () => clearInterval(id);
+    }, [showAgo, lastRefreshAt]);
+
     const planBadge = chalk.bold.cyan(`[${planType.toUpperCase()}]`);
 
     let status: string;
@@ -2,10 +2,12 @@
  * Donut/ring chart component showing quota usage.
  */
 
-import React from "react";
+import React, { useEffect, useState } from "react";
 import { Box, Text } from "ink";
 import chalk from "chalk";
 
+import { formatCountdown } from "../models.js";
+
 interface PieChartProps {
   usagePct: number;
   label: string;
@@ -24,118 +26,159 @@ function getBoldColor(pct: number): (s: string) => string {
   return chalk.bold.red;
 }
 
-function formatResetTime(reset: Date): string {
-  const diffMs = reset.getTime() - Date.now();
-
-  if (diffMs <= 0) return "now";
+// Donut dimensions
+const OUTER_R = 6.5;
+const INNER_R = 5.0;
+const ROWS = Math.floor(OUTER_R * 2) + 1;
+const COLS = Math.floor(OUTER_R * 4) + 1;
+const CENTER_Y = OUTER_R;
+const CENTER_X = OUTER_R * 2;
+
+type Cell = { char: string; style: ((s: string) => string) | null };
+
+const BLANK_CELL: Cell = { char: " ", style: null };
+
+// The geometry never changes, so find the ring cells and their angle
+// (clockwise from top) once instead of on every render.
+const RING_CELLS: Array<{ row: number; col: number; angle: number }> = [];
+for (let row = 0; row < ROWS; row++) {
+  for (let col = 0; col < COLS; col++) {
+    const dy = row - CENTER_Y;
+    const dx = (col - CENTER_X) / 2.0;
+    const dist = Math.sqrt(dx * dx + dy * dy);
+    if (INNER_R <= dist && dist <= OUTER_R) {
+      let angle = Math.atan2(dx, -dy);
+      if (angle < 0) angle += 2 * Math.PI;
+      RING_CELLS.push({ row, col, angle });
+    }
+  }
+}
 
-  const totalMinutes = Math.floor(diffMs / 60000);
-  const totalHours = Math.floor(diffMs / 3600000);
-  const totalDays = Math.floor(diffMs / 86400000);
+function countdownText(resetTime: Date): string {
+  const remaining = Math.max(0, Math.floor((resetTime.getTime() - Date.now()) / 1000));
+  return formatCountdown(remaining);
+}
 
-  if (totalMinutes < 1) return "in less than a minute";
-  if (totalMinutes < 60) {
-    return `in ${totalMinutes} minute${totalMinutes !== 1 ? "s" : ""}`;
-  }
-  if (totalHours < 24) {
-    const remainingMin = totalMinutes % 60;
-    if (remainingMin === 0) return `in ${totalHours} hour${totalHours !== 1 ? "s" : ""}`;
-    return `in ${totalHours} hour${totalHours !== 1 ? "s" : ""}, ${remainingMin} min`;
-  }
-  const remainingHrs = totalHours % 24;
-  if (remainingHrs === 0) return `in ${totalDays} day${totalDays !== 1 ? "s" : ""}`;
-  return `in ${totalDays} day${totalDays !== 1 ? "s" : ""}, ${remainingHrs} hour${remainingHrs !== 1 ? "s" : ""}`;
+/**
+ * "Resets in …" line. The text only changes when a whole minute of the
+ * remaining time elapses, so it sleeps until that boundary instead of
+ * re-rendering every second; the memoized donut above it is left alone.
+ */
+function ResetLine({ resetTime }: { resetTime: Date }): React.ReactElement {
+  const [text, setText] = useState(() => countdownText(resetTime));
+  useEffect(() => {
+    setText(countdownText(resetTime));
+    let id: ReturnType<typeof setTimeout> | undefined;
+    const schedule = () => {
+      const msLeft = resetTime.getTime() - Date.now();
+      if (msLeft <= 0) return;
+      id = setTimeout(() => {
+        setText(countdownText(resetTime));
+        schedule();
+      }, (msLeft % 60_000) + 1);
+    };
+    schedule();
+    return () => clearTimeout(id);
+  }, [resetTime]);
+  return <Text dimColor>Resets {text}</Text>;
 }
 
-export function PieChart({
-  usagePct,
-  label,
-  resetTime,
-}: PieChartProps): React.ReactElement {
-  const pct = Math.max(0, Math.min(100, usagePct));
+/** Draw the donut (ring, centered percentage and label) as styled lines. */
+function renderDonut(pct: number, label: string): string[] {
   const color = getColor(pct);
   const boldColor = getBoldColor(pct);
 
-  // Donut dimensions
-  const outerR = 6.5;
-  const innerR = 5.0;
-  const rows = Math.floor(outerR * 2) + 1;
-  const cols = Math.floor(outerR * 4) + 1;
-
   // Usage fills clockwise from top
   const usedAngle = 2 * Math.PI * (pct / 100);
 
-  const centerY = outerR;
-  const centerX = outerR * 2;
-
   // Build grid
-  type Cell = { char: string; style: ((s: string) => string) | null };
-  const grid: Cell[][] = [];
-
-  for (let row = 0; row < rows; row++) {
-    const line: Cell[] = [];
-    for (let col = 0; col < cols; col++) {
-      const dy = row - centerY;
-      const dx = (col - centerX) / 2.0;
-      const dist = Math.sqrt(dx * dx + dy * dy);
-
-      if (innerR <= dist && dist <= outerR) {
-        let angle = Math.atan2(dx, -dy);
-        if (angle < 0) angle += 2 * Math.PI;
-
-        if (angle <= usedAngle) {
-          line.push({ char: "█", style: color });
-        } else {
-          line.push({ char: "░", style: chalk.gray });
-        }
-      } else {
-        line.push({ char: " ", style: null });
-      }
-    }
-    grid.push(line);
+  const grid: Cell[][] = Array.from({ length: ROWS }, () =>
+    new Array<Cell>(COLS).fill(BLANK_CELL),
+  );
+  const usedCell: Cell = { char: "█", style: color };
+  const freeCell: Cell = { char: "░", style: chalk.gray };
+  for (const { row, col, angle } of RING_CELLS) {
+    grid[row]![col] = angle <= usedAngle ? usedCell : freeCell;
   }
 
   // Place percentage text in center
   const pctStr = `${Math.round(pct)}%`;
-  const centerRow = Math.floor(rows / 2);
-  const startCol = Math.floor(centerX - pctStr.length / 2);
+  const centerRow = Math.floor(ROWS / 2);
+  const startCol = Math.floor(CENTER_X - pctStr.length / 2);
   for (let i = 0; i < pctStr.length; i++) {
     const colIdx = startCol + i;
-    if (colIdx >= 0 && colIdx < cols) {
+    if (colIdx >= 0 && colIdx < COLS) {
       grid[centerRow]![colIdx] = { char: pctStr[i]!, style: boldColor };
     }
   }
 
   // Place label below percentage
   const labelRow = centerRow + 1;
-  const labelStart = Math.floor(centerX - label.length / 2);
-  if (labelRow < rows) {
+  const labelStart = Math.floor(CENTER_X - label.length / 2);
+  if (labelRow < ROWS) {
     for (let i = 0; i < label.length; i++) {
       const colIdx = labelStart + i;
-      if (colIdx >= 0 && colIdx < cols) {
+      if (colIdx >= 0 && colIdx < COLS) {
         grid[labelRow]![colIdx] = { char: label[i]!, style: chalk.dim };
       }
     }
   }
 
-  // Render to lines
+  // Render to lines, styling each run of same-style cells in one call
   const lines: string[] = [];
   for (const row of grid) {
     let line = "";
+    let run = "";
+    let runStyle = row[0]!.style;
     for (const cell of row) {
-      line += cell.style ? cell.style(cell.char) : cell.char;
+      if (cell.style !== runStyle) {
+        line += runStyle ? runStyle(run) : run;
+        run = "";
+        runStyle = cell.style;
+      }
+      run += cell.char;
     }
+    line += runStyle ? runStyle(run) : run;
     lines.push(line);
   }
 
+  return lines;
+}
+
+// Shared across instances and remounts (toggling help unmounts the charts).
+// Bounded; the oldest entry is evicted first.
+const DONUT_CACHE_SIZE = 512;
+const donutCache = new Map<string, string[]>();
+
+function cachedDonut(pct: number, label: string): string[] {
+  const key = `${pct}|${label}`;
+  let lines = donutCache.get(key);
+  if (!lines) {
+    lines = renderDonut(pct, label);
+    if (donutCache.size >= DONUT_CACHE_SIZE) {
+      donutCache.delete(donutCache.keys().next().value!);
+    }
+    donutCache.set(key, lines);
+  }
+  return lines;
+}
+
+// Memoized: the component skips unrelated App updates, and the donut lines
+// come from the shared cache unless the percentage or label is new.
+export const PieChart = React.memo(function PieChart({
+  usagePct,
+  label,
+  resetTime,
+}: PieChartProps): React.ReactElement {
+  const pct = Math.max(0, Math.min(100, usagePct));
+  const lines = cachedDonut(pct, label);
+
   return (
     <Box flexDirection="column" alignItems="center" paddingY={0}>
       {lines.map((line, i) => (
         <Text key={i}>{line}</Text>
       ))}
-      {resetTime && (
-        <Text dimColor>Resets {formatResetTime(resetTime)}</Text>
-      )}
+      {resetTime && <ResetLine resetTime={resetTime} />}
     </Box>
   );
-}
+});
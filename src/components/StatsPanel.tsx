@@ -41,13 +41,14 @@ export function StatsPanel({
   }
 
   const q = quotaData;
+  const now = Date.now();
   const lines: string[] = [];
 
   // 5-hour window
   const fiveColor = usageColor(q.fiveHourUsagePct);
   lines.push(chalk.bold("5-Hour Window"));
   lines.push(`  ├ Used:     ${fiveColor(`${Math.round(q.fiveHourUsagePct)}%`)}`);
-  lines.push(`  ├ Resets:   ${formatCountdown(fiveHourRemainingSeconds(q))}`);
+  lines.push(`  ├ Resets:   ${formatCountdown(fiveHourRemainingSeconds(q, now))}`);
   lines.push(`  └ Messages: ~${estimateMessages(q.fiveHourUsagePct)}`);
   lines.push("");
 
@@ -55,7 +56,7 @@ export function StatsPanel({
   const sevenColor = usageColor(q.sevenDayUsagePct);
   lines.push(chalk.bold("7-Day Window"));
   lines.push(`  ├ Used:     ${sevenColor(`${Math.round(q.sevenDayUsagePct)}%`)}`);
-  lines.push(`  └ Resets:   ${formatCountdown(sevenDayRemainingSeconds(q))}`);
+  lines.push(`  └ Resets:   ${formatCountdown(sevenDayRemainingSeconds(q, now))}`);
   lines.push("");
 
   // Model quotas
@@ -2,7 +2,12 @@
  * Configuration management for claudemon.
  */
 
-import { existsSync, mkdirSync, readFileSync, writeFileSync } from "node:fs";
+import {
+  mkdirSync,
+  readFileSync,
+  statSync,
+  writeFileSync,
+} from "node:fs";
 import { homedir } from "node:os";
 import { join } from "node:path";
 import { parse as parseTOML } from "smol-toml";
@@ -48,19 +53,33 @@ const DEFAULT_CONFIG: Record<string, string | number | boolean> = {
 };
 
 export function ensureConfigDir(): void {
-  if (!existsSync(CONFIG_DIR)) {
-    mkdirSync(CONFIG_DIR, { recursive: true });
-  }
+  // recursive: true is a no-op when the directory already exists
+  mkdirSync(CONFIG_DIR, { recursive: true });
 }
 
+// Parsed config.toml, keyed on its mtime so outside edits are still seen
+// while repeated loads (e.g. one per API request) skip the re-parse.
+let configCache: {
+  mtimeMs: number;
+  config: Record<string, string | number | boolean>;
+} | null = null;
+
 export function loadConfig(): Record<string, string | number | boolean> {
-  if (!existsSync(CONFIG_FILE)) {
+  let mtimeMs: number;
+  try {
+    mtimeMs = statSync(CONFIG_FILE).mtimeMs;
+  } catch {
     return { ...DEFAULT_CONFIG };
   }
+  if (configCache && configCache.mtimeMs === mtimeMs) {
+    return { ...configCache.config };
+  }
   try {
     const raw = readFileSync(CONFIG_FILE, "utf-8");
-    const config = parseTOML(raw) as Record<string, string | number | boolean>;
-    return { ...DEFAULT_CONFIG, ...config };
+    const parsed = parseTOML(raw) as Record<string, string | number | boolean>;
+    const config = { ...DEFAULT_CONFIG, ...parsed };
+    configCache = { mtimeMs, config };
+    return { ...config };
   } catch {
     return { ...DEFAULT_CONFIG };
   }
@@ -81,6 +100,7 @@ export function saveConfig(
     }
   }
   writeFileSync(CONFIG_FILE, lines.join("\n") + "\n");
+  configCache = null;
 }
 
 export function getConfigValue(
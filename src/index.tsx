@@ -5,10 +5,7 @@
  */
 
 import { createRequire } from "node:module";
-import React from "react";
-import { render } from "ink";
 
-import { App } from "./app.js";
 import { validateToken } from "./api.js";
 
 const require = createRequire(import.meta.url);
@@ -49,23 +46,53 @@ const LOGO = `
                                  ---===---
 `;
 
+interface CliOptions {
+  help: boolean;
+  version: boolean;
+  setup: boolean;
+  forceReauth: boolean;
+}
+
+function parseArgs(args: string[]): CliOptions {
+  const options: CliOptions = {
+    help: false,
+    version: false,
+    setup: args[0] === "setup",
+    forceReauth: false,
+  };
+  for (const arg of args) {
+    switch (arg) {
+      case "--help":
+      case "-h":
+        options.help = true;
+        break;
+      case "--version":
+        options.version = true;
+        break;
+      case "--re":
+        options.forceReauth = true;
+        break;
+    }
+  }
+  return options;
+}
+
 async function main(): Promise<void> {
-  const args = process.argv.slice(2);
+  const options = parseArgs(process.argv.slice(2));
 
-  if (args.includes("--help") || args.includes("-h")) {
+  if (options.help) {
     printHelp();
     return;
   }
 
-  if (args.includes("--version")) {
+  if (options.version) {
     console.log(LOGO);
     console.log(`claudemon ${VERSION}`);
     return;
   }
 
-  if (args[0] === "setup") {
-    const forceReauth = args.includes("--re");
-    await runSetup(forceReauth);
+  if (options.setup) {
+    await runSetup(options.forceReauth);
     return;
   }
 
@@ -78,10 +105,20 @@ async function main(): Promise<void> {
   }
   console.log("✓ Token is valid.\n");
 
+  // Only the dashboard needs React/Ink, so load them here rather than on
+  // every invocation (--help, --version, setup).
+  const [{ default: React }, { render }, { App }] = await Promise.all([
+    import("react"),
+    import("ink"),
+    import("./app.js"),
+  ]);
+
   // Launch TUI (full-screen alternate screen)
   process.stdout.write("\x1b[?1049h"); // enter alternate screen
   process.stdout.write("\x1b[2J\x1b[H"); // clear + home
-  const instance = render(<App version={VERSION} />);
+  const instance = render(
+    React.createElement(App, { version: VERSION, initialQuota: result.quota }),
+  );
   instance.waitUntilExit().then(() => {
     process.stdout.write("\x1b[?1049l"); // restore main screen
   });
@@ -40,6 +40,32 @@ export function createQuotaData(partial?: Partial<QuotaData>): QuotaData {
   };
 }
 
+function sameTime(a: Date | null, b: Date | null): boolean {
+  return a === b || (a !== null && b !== null && a.getTime() === b.getTime());
+}
+
+/**
+ * Value equality for QuotaData. Every poll builds a fresh object (and fresh
+ * Dates), so callers use this to keep the previous one when nothing changed.
+ */
+export function quotaDataEqual(a: QuotaData, b: QuotaData): boolean {
+  if (a === b) return true;
+  if (
+    a.fiveHourUsagePct !== b.fiveHourUsagePct ||
+    a.sevenDayUsagePct !== b.sevenDayUsagePct ||
+    a.planType !== b.planType ||
+    !sameTime(a.fiveHourResetTime, b.fiveHourResetTime) ||
+    !sameTime(a.sevenDayResetTime, b.sevenDayResetTime) ||
+    a.modelQuotas.length !== b.modelQuotas.length
+  ) {
+    return false;
+  }
+  return a.modelQuotas.every((mq, i) => {
+    const other = b.modelQuotas[i]!;
+    return mq.modelName === other.modelName && mq.usagePct === other.usagePct;
+  });
+}
+
 export function createTokenData(partial?: Partial<TokenData>): TokenData {
   return {
     inputTokens: 0,
@@ -54,15 +80,16 @@ export function tokenTotal(t: TokenData): number {
   return t.inputTokens + t.outputTokens + t.cacheRead + t.cacheWrite;
 }
 
-export function fiveHourRemainingSeconds(q: QuotaData): number {
+// `now` lets a caller rendering both windows read the clock once.
+export function fiveHourRemainingSeconds(q: QuotaData, now = Date.now()): number {
   if (!q.fiveHourResetTime) return 0;
-  const delta = q.fiveHourResetTime.getTime() - Date.now();
+  const delta = q.fiveHourResetTime.getTime() - now;
   return Math.max(0, Math.floor(delta / 1000));
 }
 
-export function sevenDayRemainingSeconds(q: QuotaData): number {
+export function sevenDayRemainingSeconds(q: QuotaData, now = Date.now()): number {
   if (!q.sevenDayResetTime) return 0;
-  const delta = q.sevenDayResetTime.getTime() - Date.now();
+  const delta = q.sevenDayResetTime.getTime() - now;
   return Math.max(0, Math.floor(delta / 1000));
 }
 
@@ -77,17 +104,21 @@ export function formatTokens(count: number): string {
 
 export function formatCountdown(totalSeconds: number): string {
   if (totalSeconds <= 0) return "now";
+  // Common case first: under an hour only the minute count matters
+  if (totalSeconds < 3600) {
+    const minutes = Math.floor(totalSeconds / 60);
+    if (minutes < 1) return "in less than a minute";
+    return `in ${minutes} minute${minutes !== 1 ? "s" : ""}`;
+  }
   const days = Math.floor(totalSeconds / 86400);
-  const hours = Math.floor((totalSeconds % 86400) / 3600);
-  const minutes = Math.floor((totalSeconds % 3600) / 60);
+  const dayRem = totalSeconds - days * 86400;
+  const hours = Math.floor(dayRem / 3600);
+  const minutes = Math.floor((dayRem - hours * 3600) / 60);
   if (days > 0) {
     if (hours === 0) return `in ${days} day${days !== 1 ? "s" : ""}`;
     return `in ${days} day${days !== 1 ? "s" : ""}, ${hours} hour${hours !== 1 ? "s" : ""}`;
   }
-  if (hours > 0) {
-    if (minutes === 0) return `in ${hours} hour${hours !== 1 ? "s" : ""}`;
-    return `in ${hours} hour${hours !== 1 ? "s" : ""}, ${minutes} min`;
-  }
-  if (minutes < 1) return "in less than a minute";
-  return `in ${minutes} minute${minutes !== 1 ? "s" : ""}`;
+  // At least an hour remains here, so hours >= 1
+  if (minutes === 0) return `in ${hours} hour${hours !== 1 ? "s" : ""}`;
+  return `in ${hours} hour${hours !== 1 ? "s" : ""}, ${minutes} min`;
 }